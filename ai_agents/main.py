@@ -5,15 +5,26 @@ This agent acts as the primary entry point and coordinates
 all other specialized agents in the system.
 """
 
+from functools import lru_cache
 from agents import Agent, WebSearchTool
-from tools import execute_sql_query, execute_shell_command, save_memory, recall_memory
+from tools import (
+    execute_sql_query,
+    execute_sql_queries,
+    execute_shell_command,
+    save_memory,
+    recall_memory,
+)
 from .coding import create_coding_agent
 from config import load_instruction_template
 
 
+@lru_cache(maxsize=1)
 def create_main_agent() -> Agent:
     """
     Create and configure the main orchestrator agent.
+
+    The agent is built once per process; later calls return the same
+    instance instead of rebuilding its tools and schemas.
     
     This agent is responsible for:
     - Understanding user requests
@@ -47,6 +58,7 @@ def create_main_agent() -> Agent:
         # ),
         tools=[
             execute_sql_query,
+            execute_sql_queries,
             execute_shell_command,
             WebSearchTool(),
             coding_agent.as_tool(
@@ -2,10 +2,12 @@
 Агент для работы с памятью в асинхронном режиме
 """
 
+from functools import lru_cache
 from agents import Agent
 from config import load_instruction_template
-from tools import recall_memory, save_memory
+from tools import recall_memory, recall_memories_batch, save_memory, save_memories
 
+@lru_cache(maxsize=1)
 def create_memory_agent() -> Agent:
     agent = Agent(
         name="memory",
@@ -17,7 +19,9 @@ def create_memory_agent() -> Agent:
         # ),
         tools=[
             recall_memory,
+            recall_memories_batch,
             save_memory,
+            save_memories,
         ]
     )
     
@@ -1,9 +1,24 @@
 import asyncio
-from agents import Agent, Runner, WebSearchTool, ItemHelpers
+from agents import Agent, Runner, WebSearchTool, ItemHelpers, RunResult
 from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Literal
 
+
+async def run_pipeline(agents: list[Agent], prompt: str) -> RunResult:
+    """Run agents one after another, feeding each agent the previous output."""
+    result = None
+    for agent in agents:
+        result = await Runner.run(agent, prompt)
+        prompt = result.final_output
+    return result
+
+
+async def run_fanout(agents: list[Agent], prompt: str) -> list[RunResult]:
+    """Run independent agents on the same prompt concurrently."""
+    return await asyncio.gather(*(Runner.run(agent, prompt) for agent in agents))
+
+
 async def main():
     load_dotenv()
     agent1 = Agent(
@@ -20,9 +35,7 @@ async def main():
     )
 
     prompt = "What is the capital of France?"
-    result = await Runner.run(agent1, prompt)
-    result = await Runner.run(agent2, result.final_output)
-    result = await Runner.run(agent1, result.final_output)
+    result = await run_pipeline([agent1, agent2, agent1], prompt)
     print(result.final_output)
 
 if __name__ == "__main__":
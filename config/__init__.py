@@ -10,9 +10,12 @@ from .settings import (
     validate_environment,
     get_agent_config,
     get_welcome_message,
-    load_instruction_template
+    load_instruction_template,
+    preload_instruction_templates
 )
 from .session_manager import SessionManager, create_session_manager
+from .clients import ClientPool, create_openai_client
+from .env import Env, get_env
 
 __all__ = [
     'load_environment',
@@ -20,6 +23,11 @@ __all__ = [
     'get_agent_config',
     'get_welcome_message',
     'load_instruction_template',
+    'preload_instruction_templates',
     'SessionManager',
-    'create_session_manager'
+    'create_session_manager',
+    'ClientPool',
+    'create_openai_client',
+    'Env',
+    'get_env'
 ]
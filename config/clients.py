@@ -0,0 +1,89 @@
+"""
+Client pooling for external services.
+
+This module provides a small round-robin pool of pre-created API clients,
+so concurrent requests are spread over several connections instead of
+queueing behind a single one, and a factory for OpenAI clients with
+tuned connection settings.
+"""
+
+import itertools
+from typing import Callable, Generic, List, TypeVar
+
+from openai import DEFAULT_CONNECTION_LIMITS, AsyncOpenAI, DefaultAsyncHttpxClient
+
+from .env import get_env
+
+
+ClientT = TypeVar("ClientT")
+
+# Connection limits of each OpenAI client; idle connections are kept
+# long enough to survive the pause between two chat turns. Built from the
+# SDK's own limits type, as newer openai releases ship their own httpx fork
+OPENAI_CONNECTION_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=120.0,
+)
+
+
+class ClientPool(Generic[ClientT]):
+    """
+    Round-robin pool of API clients.
+
+    All clients are created up front by the given factory and handed out
+    in turn, each client keeping its own connection.
+    """
+
+    def __init__(self, factory: Callable[[], ClientT], size: int = 4):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable creating a new client instance
+            size: Number of clients to create
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("Client pool size must be at least 1")
+
+        self._clients: List[ClientT] = [factory() for _ in range(size)]
+        self._round_robin = itertools.cycle(self._clients)
+
+    def __next__(self) -> ClientT:
+        """
+        Get the next client in round-robin order.
+
+        Returns:
+            ClientT: Client instance from the pool
+        """
+        return next(self._round_robin)
+
+    @property
+    def clients(self) -> List[ClientT]:
+        """
+        Get all clients in the pool.
+
+        Returns:
+            List[ClientT]: Pooled client instances
+        """
+        return list(self._clients)
+
+
+def create_openai_client() -> AsyncOpenAI:
+    """
+    Create an async OpenAI client with tuned connection limits.
+
+    Idle connections are kept alive across chat turns instead of being
+    closed after the 5 second default, so a new turn doesn't pay for a
+    fresh TLS handshake.
+
+    Returns:
+        AsyncOpenAI: Configured client
+    """
+    return AsyncOpenAI(
+        api_key=get_env().openai_api_key,
+        http_client=DefaultAsyncHttpxClient(limits=OPENAI_CONNECTION_LIMITS),
+    )
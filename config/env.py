@@ -0,0 +1,100 @@
+"""
+Environment variables used by the application.
+
+This module reads the environment once into an immutable snapshot,
+so client factories don't look variables up on every use and missing
+values are reported by validation at startup.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Env:
+    """
+    Immutable snapshot of the environment variables used by the application.
+
+    Attributes:
+        openai_api_key: OpenAI API key (OPENAI_API_KEY)
+        database_url: PostgreSQL connection URL (DATABASE_URL)
+        qdrant_url: QDRANT server URL (QDRANT_URL)
+        qdrant_grpc_port: QDRANT gRPC port (QDRANT_GRPC_PORT)
+        openai_pool_size: Number of pooled OpenAI clients for memory tools
+            (OPENAI_POOL_SIZE)
+        qdrant_pool_size: Number of pooled QDRANT clients (QDRANT_POOL_SIZE)
+        embedding_model: OpenAI embedding model (EMBEDDING_MODEL)
+        embedding_dim: Embedding vector size (EMBEDDING_DIM)
+        embedding_cache_size: Number of embeddings kept in process
+            (EMBEDDING_CACHE_SIZE)
+        recall_cache_size: Number of cached recall results (RECALL_CACHE_SIZE)
+        recall_cache_threshold: Cosine similarity at which a cached recall
+            result is reused (RECALL_CACHE_THRESHOLD)
+        recall_cache_ttl: Lifetime of cached recall results in seconds
+            (RECALL_CACHE_TTL)
+        recall_score_threshold: Weakest match returned by recall
+            (RECALL_SCORE_THRESHOLD)
+        recall_snippet_length: Longest memory text returned by recall
+            (RECALL_SNIPPET_LENGTH)
+        stream_flush_bytes: Pending streamed bytes that trigger a terminal
+            write (STREAM_FLUSH_BYTES)
+        stream_flush_interval: Longest time in seconds streamed output may
+            stay pending (STREAM_FLUSH_INTERVAL)
+    """
+
+    openai_api_key: Optional[str]
+    database_url: Optional[str]
+    qdrant_url: str
+    qdrant_grpc_port: int
+    openai_pool_size: int
+    qdrant_pool_size: int
+    embedding_model: str
+    embedding_dim: int
+    embedding_cache_size: int
+    recall_cache_size: int
+    recall_cache_threshold: float
+    recall_cache_ttl: float
+    recall_score_threshold: float
+    recall_snippet_length: int
+    stream_flush_bytes: int
+    stream_flush_interval: float
+
+    @classmethod
+    def from_environ(cls) -> "Env":
+        """
+        Build a snapshot from the current process environment.
+
+        Returns:
+            Env: Environment snapshot
+        """
+        return cls(
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            database_url=os.getenv("DATABASE_URL"),
+            qdrant_url=os.getenv("QDRANT_URL", "http://localhost:6333"),
+            qdrant_grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+            openai_pool_size=int(os.getenv("OPENAI_POOL_SIZE", "2")),
+            qdrant_pool_size=int(os.getenv("QDRANT_POOL_SIZE", "4")),
+            embedding_model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
+            embedding_dim=int(os.getenv("EMBEDDING_DIM", "1536")),
+            embedding_cache_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "4096")),
+            recall_cache_size=int(os.getenv("RECALL_CACHE_SIZE", "1024")),
+            recall_cache_threshold=float(os.getenv("RECALL_CACHE_THRESHOLD", "0.95")),
+            recall_cache_ttl=float(os.getenv("RECALL_CACHE_TTL", "300")),
+            recall_score_threshold=float(os.getenv("RECALL_SCORE_THRESHOLD", "0.35")),
+            recall_snippet_length=int(os.getenv("RECALL_SNIPPET_LENGTH", "200")),
+            stream_flush_bytes=int(os.getenv("STREAM_FLUSH_BYTES", "4096")),
+            stream_flush_interval=float(os.getenv("STREAM_FLUSH_INTERVAL", "0.016")),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_env() -> Env:
+    """
+    Get the environment snapshot, reading the environment on first use.
+
+    Returns:
+        Env: Environment snapshot
+    """
+    return Env.from_environ()
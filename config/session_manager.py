@@ -5,12 +5,15 @@ This module handles session creation, management, and lifecycle
 using SQLAlchemy-powered sessions from OpenAI Agents SDK.
 """
 
-import os
+import asyncio
 import uuid
 from typing import Optional
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from agents.extensions.memory import SQLAlchemySession
 
+from .env import get_env
+
 
 class SessionManager:
     """
@@ -22,6 +25,10 @@ class SessionManager:
     - Session persistence using SQLAlchemy
     """
     
+    POOL_SIZE = 5
+    MAX_OVERFLOW = 5
+    POOL_RECYCLE = 1800  # Seconds before a pooled connection is replaced
+    
     def __init__(self, database_url: Optional[str] = None):
         """
         Initialize the session manager.
@@ -32,7 +39,7 @@ class SessionManager:
         Raises:
             ValueError: If database_url is not provided and DATABASE_URL env var is not set
         """
-        self._database_url = database_url or os.getenv('DATABASE_URL')
+        self._database_url = database_url or get_env().database_url
         if not self._database_url:
             raise ValueError(
                 "Database URL must be provided either as parameter or via DATABASE_URL env variable"
@@ -50,12 +57,20 @@ class SessionManager:
             AsyncEngine: SQLAlchemy async engine instance
         """
         if self._engine is None:
+            pool_options = {}
+            # SQLite keeps SQLAlchemy's default pool, which in-memory databases rely on
+            if make_url(self._database_url).get_backend_name() != "sqlite":
+                pool_options = {
+                    "pool_size": self.POOL_SIZE,
+                    "max_overflow": self.MAX_OVERFLOW,
+                    "pool_recycle": self.POOL_RECYCLE,
+                    "pool_use_lifo": True,  # Reuse the most recent, still warm connection
+                }
             self._engine = create_async_engine(
                 self._database_url,
                 echo=False,  # Set to True for SQL query logging
                 pool_pre_ping=True,  # Verify connections before using
-                pool_size=5,
-                max_overflow=10
+                **pool_options
             )
         return self._engine
     
@@ -105,6 +120,18 @@ class SessionManager:
         """
         return self._current_session_id
     
+    async def warmup(self) -> None:
+        """
+        Pre-open database connections to fill the engine's connection pool.
+        
+        Opens POOL_SIZE connections concurrently and returns them to the pool,
+        so the first requests don't pay connection setup latency.
+        """
+        connections = await asyncio.gather(
+            *(self.engine.connect() for _ in range(self.POOL_SIZE))
+        )
+        await asyncio.gather(*(connection.close() for connection in connections))
+    
     async def cleanup(self) -> None:
         """
         Clean up resources and close database connections.
@@ -5,22 +5,57 @@ This module handles environment variable loading, validation,
 and provides configuration for the AI agent.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from dotenv import load_dotenv
 from agents import Agent
 
+from .env import get_env
+
 
 def load_environment() -> None:
     """Load environment variables from .env file."""
     load_dotenv()
+    # Re-read the environment snapshot with the loaded values
+    get_env.cache_clear()
+
+
+INSTRUCTIONS_DIR = Path(__file__).parent.parent / "instructions"
+
+# Shared Jinja2 environment: compiled templates are kept in its cache and
+# their bytecode on disk, so new processes skip lexing and parsing
+_template_env = Environment(
+    loader=FileSystemLoader(INSTRUCTIONS_DIR),
+    bytecode_cache=FileSystemBytecodeCache(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    cache_size=400
+)
+
+
+def preload_instruction_templates() -> None:
+    """
+    Compile all instruction templates ahead of the first agent creation.
+    
+    Raises:
+        Exception: If a template cannot be compiled
+    """
+    for template_name in _template_env.list_templates(extensions=["jinja2"]):
+        try:
+            _template_env.get_template(template_name)
+        except Exception as e:
+            raise Exception(f"Failed to compile template '{template_name}': {str(e)}")
 
 
 def load_instruction_template(template_name: str, **context) -> str:
     """
     Load and render a Jinja2 instruction template.
     
+    Rendered text is cached per template name and context when all
+    context values are hashable, so repeated agent creation is a lookup.
+    
     Args:
         template_name: Name of the template file (e.g., "main.jinja2")
         **context: Variables to pass to the template for rendering
@@ -32,27 +67,34 @@ def load_instruction_template(template_name: str, **context) -> str:
         FileNotFoundError: If template file doesn't exist
         Exception: If template rendering fails
     """
-    # Get the project root directory
-    project_root = Path(__file__).parent.parent
-    instructions_dir = project_root / "instructions"
+    try:
+        cache_key = frozenset(context.items())
+        hash(cache_key)
+    except TypeError:
+        return _render_instruction_template(template_name, context)
     
-    if not instructions_dir.exists():
-        raise FileNotFoundError(f"Instructions directory not found: {instructions_dir}")
+    return _render_cached_instruction_template(template_name, cache_key)
+
+
+@lru_cache(maxsize=256)
+def _render_cached_instruction_template(
+    template_name: str, context: frozenset
+) -> str:
+    """Render a template with hashable context, memoizing the result."""
+    return _render_instruction_template(template_name, dict(context))
+
+
+def _render_instruction_template(template_name: str, context: dict) -> str:
+    """Render a template from the instructions directory."""
+    if not INSTRUCTIONS_DIR.exists():
+        raise FileNotFoundError(f"Instructions directory not found: {INSTRUCTIONS_DIR}")
     
-    template_path = instructions_dir / template_name
+    template_path = INSTRUCTIONS_DIR / template_name
     if not template_path.exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
     
     try:
-        # Create Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(instructions_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Load and render template
-        template = env.get_template(template_name)
+        template = _template_env.get_template(template_name)
         return template.render(**context)
         
     except Exception as e:
@@ -66,23 +108,27 @@ def validate_environment() -> tuple[bool, list[str]]:
     Returns:
         tuple: (is_valid, missing_variables)
     """
-    required_vars = [
-        'OPENAI_API_KEY',
-        'DATABASE_URL'
-    ]
+    env = get_env()
+    required_vars = {
+        'OPENAI_API_KEY': env.openai_api_key,
+        'DATABASE_URL': env.database_url
+    }
     
     missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
+    for var, value in required_vars.items():
+        if not value:
             missing_vars.append(var)
     
     return len(missing_vars) == 0, missing_vars
 
 
+@lru_cache(maxsize=1)
 def get_agent_config() -> dict:
     """
     Get AI agent configuration.
     
+    The configuration is built once; callers must not modify the returned dict.
+    
     Returns:
         dict: Agent configuration including name, instructions, and capabilities
         
@@ -6,8 +6,17 @@ with the AI agent system.
 """
 
 import asyncio
-from agents import Runner
+import io
+import os
+import sys
+import threading
+from typing import Optional
+from agents import RawResponsesStreamEvent, Runner, set_default_openai_client
 from agents.extensions.memory import SQLAlchemySession
+from openai.types.responses import (
+    ResponseReasoningSummaryTextDeltaEvent,
+    ResponseTextDeltaEvent,
+)
 
 
 # Import configuration
@@ -16,18 +25,188 @@ from config import (
     validate_environment,
     get_agent_config,
     get_welcome_message,
+    get_env,
+    create_openai_client,
     create_session_manager,
+    preload_instruction_templates,
 )
 
 # Import AI agents
 from ai_agents import create_main_agent
 
+# Import tool warmup, recall cache invalidation and connection cleanup
+from tools import close_clients, close_pool, set_memory_generation, warmup_memory
+
 # Import memory processor for parallel memory operations
-from memory_processor import start_memory_processing
+from memory_processor import MemoryWorker
+
+# Output separators
+SEP_EQ = "=" * 60
+SEP_DASH = "-" * 60
+
+# ANSI color codes, pre-encoded for direct writes to the stdout buffer
+GRAY_B = b"\033[90m"
+RESET_B = b"\033[0m"
+
+STDOUT_ENCODING = sys.stdout.encoding or "utf-8"
+
+# Section headers of the streamed output, pre-encoded
+REASONING_HEADER = f"\n\033[90m[REASONING] Reasoning Process:\n{SEP_DASH}\n".encode(
+    STDOUT_ENCODING
+)
+REASONING_FOOTER = f"\033[0m\n{SEP_DASH}\n".encode(STDOUT_ENCODING)
+RESPONSE_HEADER = f"\n[RESPONSE] Agent Response:\n{SEP_DASH}\n".encode(STDOUT_ENCODING)
+
+# Commands that end the chat
+_EXIT_CMDS = frozenset(("exit", "quit", "bye", "q"))
+
+class TerminalFlusher:
+    """
+    Coalesces streamed output into fewer terminal writes.
+
+    Bytes are collected in a buffer and written to stdout once enough
+    are pending, or at the latest after a short interval, so the terminal
+    is updated in frames rather than once per token.
+    """
+
+    def __init__(self, flush_threshold: int = 4096, flush_interval: float = 0.016):
+        """
+        Initialize the flusher.
+
+        Args:
+            flush_threshold: Pending bytes that trigger an immediate write
+            flush_interval: Longest time in seconds output may stay pending
+        """
+        self._stream = sys.stdout.buffer
+        self._buffer = bytearray()
+        self._flush_threshold = flush_threshold
+        self._flush_interval = flush_interval
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, data: bytes) -> None:
+        """
+        Queue bytes for output, writing them when a flush is due.
+
+        Args:
+            data: Encoded text to write
+        """
+        self._buffer += data
+        if len(self._buffer) >= self._flush_threshold:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._flush_interval, self.flush
+            )
+
+    def flush(self) -> None:
+        """Write all pending bytes to the terminal."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+        self._stream.flush()
+
+
+# Bytes read from stdin that don't form a complete line yet
+_stdin_pending = bytearray()
+
+
+async def read_user_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    On POSIX the loop watches stdin and the line is read from its file
+    descriptor once data is available, so nothing is left blocked on stdin
+    when the chat is interrupted. On Windows, where the loop can't watch
+    console handles, the blocking input() call runs in a daemon thread.
+
+    Args:
+        prompt: Prompt to display
+
+    Returns:
+        str: Line entered by the user
+
+    Raises:
+        EOFError: If stdin is closed
+    """
+    if sys.platform == "win32":
+        return await _read_user_input_thread(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+    while (end := _stdin_pending.find(b"\n")) < 0:
+        readable = loop.create_future()
+        try:
+            loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        except PermissionError:
+            # Regular files can't be watched, but reading them never blocks
+            pass
+        else:
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            if not _stdin_pending:
+                raise EOFError
+            # Last line without a trailing newline
+            end = len(_stdin_pending)
+            break
+        _stdin_pending.extend(chunk)
+
+    line = _stdin_pending[:end].decode(sys.stdin.encoding or "utf-8", "replace")
+    del _stdin_pending[:end + 1]
+    return line
+
+
+async def _read_user_input_thread(prompt: str) -> str:
+    """
+    Read a line from stdin with input() running in a daemon thread.
+
+    Args:
+        prompt: Prompt to display
+
+    Returns:
+        str: Line entered by the user
+
+    Raises:
+        EOFError: If stdin is closed
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(result: str, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_resolve, "", e)
+        else:
+            loop.call_soon_threadsafe(_resolve, line, None)
+
+    threading.Thread(target=_read, name="stdin-reader", daemon=True).start()
+    return await future
 
 
 async def process_user_input(
-    agent, user_input: str, session: SQLAlchemySession
+    agent,
+    user_input: str,
+    session: SQLAlchemySession,
+    memory_worker: MemoryWorker,
 ) -> None:
     """
     Process a single user input with the AI agent using streaming.
@@ -36,21 +215,22 @@ async def process_user_input(
         agent: The AI agent instance to process the request
         user_input: User's text input
         session: SQLAlchemy session for context preservation
+        memory_worker: Background worker for memory processing
 
     This function handles streaming of both reasoning process
     and final responses with appropriate formatting.
-    After processing, it starts a parallel process for memory operations.
+    Streamed text is encoded once and written to the terminal in
+    coalesced frames rather than per token.
+    After processing, it queues the conversation for memory operations.
     """
-    # ANSI color codes
-    GRAY = "\033[90m"
-    RESET = "\033[0m"
-
     print("\n[AI] Processing your request...")
-    print("=" * 60)
+    print(SEP_EQ, flush=True)
 
     reasoning_started = False
     response_started = False
-    agent_response_text = []  # Collect full response for memory processing
+    response_text = io.StringIO()  # Collect full response for memory processing
+    env = get_env()
+    flusher = TerminalFlusher(env.stream_flush_bytes, env.stream_flush_interval)
 
     try:
         # Use run_streamed with session for context preservation
@@ -58,63 +238,65 @@ async def process_user_input(
 
         # Process streaming events - show reasoning and final answer
         async for event in result.stream_events():
-            if hasattr(event, "type") and event.type == "raw_response_event":
-                if hasattr(event, "data"):
-                    # Check if this is a reasoning summary text delta event
-                    if event.data.type == "response.reasoning_summary_text.delta":
-                        if not reasoning_started:
-                            print(f"\n{GRAY}[REASONING] Reasoning Process:")
-                            print("-" * 60)
-                            reasoning_started = True
-
-                        if hasattr(event.data, "delta") and event.data.delta:
-                            # Stream reasoning text as it comes in gray color
-                            print(
-                                f"{GRAY}{event.data.delta}{RESET}", end="", flush=True
-                            )
-
-                    # Check if this is a ResponseTextDeltaEvent (final answer streaming)
-                    elif event.data.__class__.__name__ == "ResponseTextDeltaEvent":
-                        if not response_started:
-                            if reasoning_started:
-                                print(f"{RESET}\n" + "-" * 60)
-                            print("\n[RESPONSE] Agent Response:")
-                            print("-" * 60)
-                            response_started = True
-
-                        if hasattr(event.data, "delta") and event.data.delta:
-                            # This is the actual final answer text - stream it!
-                            delta_text = event.data.delta
-                            print(delta_text, end="", flush=True)
-                            # Collect the response for memory processing
-                            agent_response_text.append(delta_text)
+            if type(event) is RawResponsesStreamEvent:
+                data = event.data
+                data_type = type(data)
+
+                # Check if this is a reasoning summary text delta event
+                if data_type is ResponseReasoningSummaryTextDeltaEvent:
+                    if not reasoning_started:
+                        flusher.add(REASONING_HEADER)
+                        flusher.flush()
+                        reasoning_started = True
+
+                    if data.delta:
+                        # Stream reasoning text as it comes in gray color
+                        encoded = data.delta.encode(STDOUT_ENCODING, "replace")
+                        flusher.add(GRAY_B)
+                        flusher.add(encoded)
+                        flusher.add(RESET_B)
+
+                # Check if this is a ResponseTextDeltaEvent (final answer streaming)
+                elif data_type is ResponseTextDeltaEvent:
+                    if not response_started:
+                        if reasoning_started:
+                            flusher.add(REASONING_FOOTER)
+                        flusher.add(RESPONSE_HEADER)
+                        flusher.flush()
+                        response_started = True
+
+                    if data.delta:
+                        # This is the actual final answer text - stream it!
+                        encoded = data.delta.encode(STDOUT_ENCODING, "replace")
+                        flusher.add(encoded)
+                        # Collect the response text as received, independent
+                        # of what the terminal encoding can represent
+                        response_text.write(data.delta)
+
+        flusher.flush()
 
         # Print separator after streaming is complete
-        print("\n" + "-" * 60)
+        print("\n" + SEP_DASH)
 
-        # Start memory processing in a separate process (non-blocking)
-        full_response = "".join(agent_response_text)
+        # Queue memory processing in the background worker (non-blocking)
+        full_response = response_text.getvalue()
         if full_response.strip():  # Only process if we got a response
-            start_memory_processing(user_input, full_response)
+            memory_worker.submit(user_input, full_response)
 
     except Exception as e:
+        flusher.flush()
         print(f"\n[ERROR] Streaming error occurred: {str(e)}")
         print("Please check your request and try again.")
-        print("-" * 60)
+        print(SEP_DASH)
 
 
-async def main():
+def prepare_environment() -> bool:
     """
-    Main function that runs an interactive CLI chat with the AI agent.
+    Load and validate environment configuration.
 
-    This function:
-    1. Loads and validates environment configuration
-    2. Creates the main orchestrator agent
-    3. Initializes session management
-    4. Runs an interactive chat loop
-    5. Handles cleanup on exit
+    Returns:
+        bool: True if all required variables are set, False otherwise
     """
-
     # Load environment variables
     load_environment()
 
@@ -127,7 +309,31 @@ async def main():
         print(
             "\nPlease check your .env file and ensure all required variables are configured."
         )
-        return
+    return is_valid
+
+
+async def main(memory_worker: MemoryWorker):
+    """
+    Main function that runs an interactive CLI chat with the AI agent.
+
+    This function:
+    1. Creates the main orchestrator agent
+    2. Initializes session management
+    3. Runs an interactive chat loop
+    4. Handles cleanup on exit
+
+    Args:
+        memory_worker: Started background worker for memory processing
+    """
+
+    # Drop cached recall results whenever the worker has saved new memories
+    set_memory_generation(memory_worker.generation)
+
+    # Route agent model calls through the tuned OpenAI client
+    set_default_openai_client(create_openai_client())
+
+    # Compile instruction templates before agents render them
+    preload_instruction_templates()
 
     # Create the main orchestrator agent from ai_agents module
     agent = create_main_agent()
@@ -138,6 +344,12 @@ async def main():
     # Create a new session for this conversation
     session = session_manager.create_session(create_tables=True)
 
+    # Open database and memory connections before the first request
+    try:
+        await asyncio.gather(session_manager.warmup(), warmup_memory())
+    except Exception as e:
+        print(f"[WARNING] Error during warmup: {str(e)}")
+
     # Display welcome message
     welcome_lines = get_welcome_message()
     for line in welcome_lines:
@@ -150,10 +362,10 @@ async def main():
         try:
             # Get user input
             print("\n[USER] You:")
-            user_input = input(">>> ").strip()
+            user_input = (await read_user_input(">>> ")).strip()
 
             # Check for exit commands
-            if user_input.lower() in ["exit", "quit", "bye", "q"]:
+            if user_input.lower() in _EXIT_CMDS:
                 print("\n[BYE] Goodbye! Thanks for using the AI Assistant!")
                 break
 
@@ -163,9 +375,9 @@ async def main():
                 continue
 
             # Process the user input with session context
-            await process_user_input(agent, user_input, session)
+            await process_user_input(agent, user_input, session, memory_worker)
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n\n[INTERRUPT] Chat interrupted. Goodbye!")
             break
         except EOFError:
@@ -177,19 +389,40 @@ async def main():
 
     # Cleanup resources
     try:
-        await session_manager.cleanup()
+        await asyncio.gather(session_manager.cleanup(), close_pool(), close_clients())
     except Exception as e:
         print(f"\n[WARNING] Error during cleanup: {str(e)}")
 
 
 if __name__ == "__main__":
-    # Set multiprocessing start method for Windows compatibility
-    import multiprocessing
+    # Set multiprocessing start method for Windows compatibility; other
+    # platforms keep their default (fork on Linux), which starts the
+    # memory worker without re-importing the whole application
+    if sys.platform == "win32":
+        import multiprocessing
+
+        try:
+            multiprocessing.set_start_method("spawn", force=True)
+        except RuntimeError:
+            # Already set, ignore
+            pass
 
+    # Use the faster libuv-based event loop where available (not on Windows)
     try:
-        multiprocessing.set_start_method("spawn", force=True)
-    except RuntimeError:
-        # Already set, ignore
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
         pass
 
-    asyncio.run(main())
+    if not prepare_environment():
+        sys.exit(1)
+
+    # Fork the background memory worker before any event loop exists, so it
+    # inherits neither loop state nor the loop's SIGINT handler
+    memory_worker = MemoryWorker()
+    memory_worker.start()
+    try:
+        asyncio.run(main(memory_worker))
+    finally:
+        memory_worker.stop()
@@ -8,23 +8,54 @@ and save relevant facts to memory.
 
 import asyncio
 import multiprocessing
-import os
-from typing import Optional
+import queue
 
 
-def run_memory_agent_process(user_input: str, agent_response: str) -> None:
+def run_memory_worker_process(
+    queue: multiprocessing.Queue, generation: multiprocessing.Value
+) -> None:
     """
-    Entry point for the memory agent process.
+    Entry point for the persistent memory worker process.
     
-    This function is called in a separate process to analyze and store
-    user interaction data without blocking the main application flow.
+    Heavy modules and the memory agent are loaded once, then conversations
+    are taken from the queue and processed one by one on a single event
+    loop until a None sentinel is received.
     
     Args:
-        user_input: The original user query/request
-        agent_response: The response generated by the main agent
+        queue: Queue of (user_input, agent_response) pairs
+        generation: Shared counter bumped after every processed conversation
+    """
+    try:
+        asyncio.run(_serve_memory_queue(queue, generation))
+    except KeyboardInterrupt:
+        # Interrupt is handled by the main process, which stops the worker
+        pass
+
+
+async def _serve_memory_queue(
+    queue: multiprocessing.Queue, generation: multiprocessing.Value
+) -> None:
+    """
+    Process queued conversations until a None sentinel is received.
+    
+    Args:
+        queue: Queue of (user_input, agent_response) pairs
+        generation: Shared counter bumped after every processed conversation
     """
-    # Run the async function in this process
-    asyncio.run(_process_memory_async(user_input, agent_response))
+    from agents import set_default_openai_client
+    from config import create_openai_client, load_environment
+
+    # Don't rely on settings inherited from the parent: a forked worker
+    # carries modules imported before .env was loaded
+    load_environment()
+    set_default_openai_client(create_openai_client())
+
+    loop = asyncio.get_running_loop()
+    while (message := await loop.run_in_executor(None, queue.get)) is not None:
+        await _process_memory_async(*message)
+        # Let other processes know their cached recall results may be stale
+        with generation.get_lock():
+            generation.value += 1
 
 
 async def _process_memory_async(user_input: str, agent_response: str) -> None:
@@ -40,7 +71,7 @@ async def _process_memory_async(user_input: str, agent_response: str) -> None:
         from agents import Runner
         from ai_agents.memory import create_memory_agent
         
-        # Create memory agent
+        # The agent is created once per process and reused for every conversation
         memory_agent = create_memory_agent()
         
         # Construct the message for memory agent with both input and response
@@ -69,38 +100,87 @@ Extract and save all relevant facts, preferences, and important information from
         print(f"[MEMORY PROCESS] Traceback:\n{traceback.format_exc()}")
 
 
-def start_memory_processing(user_input: str, agent_response: str) -> Optional[multiprocessing.Process]:
+class MemoryWorker:
     """
-    Start the memory processing in a separate process.
+    Long-lived process that runs the memory agent in the background.
     
-    This function creates and starts a new process for memory operations.
-    The process runs independently and doesn't block the main application.
+    The process is started once and fed through a bounded queue, so each
+    conversation costs a queue put instead of a process start and the
+    memory agent's imports are paid only once.
     
-    Args:
-        user_input: The original user query/request
-        agent_response: The response generated by the main agent
-        
-    Returns:
-        The started Process instance, or None if process creation failed
-        
-    Example:
-        >>> process = start_memory_processing("What's the weather?", "It's sunny")
-        >>> # Main flow continues immediately without waiting
+    The worker bumps a shared generation counter after every conversation
+    it processes, so other processes can tell when memories have changed.
     """
-    try:
-        # Create a new process for memory operations
-        process = multiprocessing.Process(
-            target=run_memory_agent_process,
-            args=(user_input, agent_response),
+    
+    def __init__(self, queue_size: int = 32):
+        """
+        Initialize the memory worker.
+        
+        Args:
+            queue_size: Maximum number of conversations waiting for processing
+        """
+        self._queue: multiprocessing.Queue = multiprocessing.Queue(maxsize=queue_size)
+        self._generation = multiprocessing.Value("q", 0)
+        self._process = multiprocessing.Process(
+            target=run_memory_worker_process,
+            args=(self._queue, self._generation),
             daemon=True  # Daemon process will be terminated when main process exits
         )
+    
+    def start(self) -> None:
+        """Start the worker process."""
+        self._process.start()
+    
+    @property
+    def generation(self) -> multiprocessing.Value:
+        """
+        Get the counter bumped after every processed conversation.
         
-        # Start the process
-        process.start()
+        Returns:
+            multiprocessing.Value: Shared integer counter
+        """
+        return self._generation
+    
+    def submit(self, user_input: str, agent_response: str) -> bool:
+        """
+        Queue a conversation for memory processing without blocking.
         
-        return process
+        Args:
+            user_input: The original user query/request
+            agent_response: The response generated by the main agent
+            
+        Returns:
+            True if the conversation was queued, False otherwise
+            
+        Example:
+            >>> worker.submit("What's the weather?", "It's sunny")
+            >>> # Main flow continues immediately without waiting
+        """
+        try:
+            self._queue.put_nowait((user_input, agent_response))
+            return True
+        except queue.Full:
+            print("[MEMORY] Warning: Memory queue is full, conversation skipped")
+            return False
+        except Exception as e:
+            print(f"[MEMORY] Warning: Could not queue memory processing: {str(e)}")
+            return False
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker after queued conversations are processed.
         
-    except Exception as e:
-        print(f"[MEMORY] Warning: Could not start memory processing: {str(e)}")
-        return None
-
+        Args:
+            timeout: Seconds to wait for the worker before terminating it
+        """
+        if not self._process.is_alive():
+            return
+        
+        try:
+            self._queue.put(None, timeout=timeout)
+            self._process.join(timeout)
+        except queue.Full:
+            pass
+        
+        if self._process.is_alive():
+            self._process.terminate()
@@ -1,9 +1,10 @@
 import numpy as np
 
 # Mock timesfm functionality for testing
-class MockTimesFM:
+class _MockTimesFMModel:
     def __init__(self):
         self.model_name = "mock-timesfm"
+        self._rng = np.random.default_rng()
     
     @classmethod
     def from_pretrained(cls, model_name, torch_compile=True):
@@ -16,9 +17,10 @@ class MockTimesFM:
     
     def forecast(self, horizon, inputs):
         print(f"Mock: Forecasting horizon={horizon} for {len(inputs)} inputs")
-        # Return mock forecasts
-        point_forecast = np.random.rand(len(inputs), horizon)
-        quantile_forecast = np.random.rand(len(inputs), horizon, 10)
+        # Return mock forecasts, both sliced from a single random draw
+        forecasts = self._rng.random((len(inputs), horizon, 11), dtype=np.float32)
+        point_forecast = forecasts[..., 0]
+        quantile_forecast = forecasts[..., 1:]
         return point_forecast, quantile_forecast
 
 class MockForecastConfig:
@@ -27,12 +29,12 @@ class MockForecastConfig:
             setattr(self, key, value)
 
 # Mock the timesfm module
-class MockTimesFM:
-    TimesFM_2p5_200M_torch = MockTimesFM
+class _MockTimesFMModule:
+    TimesFM_2p5_200M_torch = _MockTimesFMModel
     ForecastConfig = MockForecastConfig
 
 # Replace the import
-timesfm = MockTimesFM()
+timesfm = _MockTimesFMModule
 
 # Your original code (now using mock)
 model = timesfm.TimesFM_2p5_200M_torch.from_pretrained("google/timesfm-2.5-200m-pytorch", torch_compile=True)
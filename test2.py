@@ -1,7 +1,8 @@
 from pybit.unified_trading import HTTP
 import os
+import sys
 from dotenv import load_dotenv
-import json
+import orjson
 
 load_dotenv()
 
@@ -13,4 +14,7 @@ session = HTTP(
 
 
 balance = session.get_wallet_balance(accountType="UNIFIED")
-print(json.dumps(balance, ensure_ascii=False, indent=4))
\ No newline at end of file
+sys.stdout.buffer.write(
+    orjson.dumps(balance, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+)
+sys.stdout.buffer.write(b"\n")
\ No newline at end of file
@@ -9,13 +9,49 @@ Each tool is implemented in a separate module for better organization
 and maintainability.
 """
 
-from .sql_tool import execute_sql_query
-from .local_shell_executor import execute_shell_command
-from .memory_tool import save_memory, recall_memory
+import importlib
+
+# Tool modules are imported on first access, so importing one tool
+# doesn't load the dependencies of all the others
+_LAZY_IMPORTS = {
+    'execute_sql_query': '.sql_tool',
+    'execute_sql_queries': '.sql_tool',
+    'close_pool': '.sql_tool',
+    'execute_shell_command': '.local_shell_executor',
+    'save_memory': '.memory_tool',
+    'save_memories': '.memory_tool',
+    'recall_memory': '.memory_tool',
+    'recall_memories_batch': '.memory_tool',
+    'warmup_memory': '.memory_tool',
+    'set_memory_generation': '.memory_tool',
+    'close_clients': '.memory_tool',
+}
 
 __all__ = [
     'execute_sql_query',
+    'execute_sql_queries',
+    'close_pool',
     'execute_shell_command',
     'save_memory',
-    'recall_memory'
+    'save_memories',
+    'recall_memory',
+    'recall_memories_batch',
+    'warmup_memory',
+    'set_memory_generation',
+    'close_clients',
 ]
+
+
+def __getattr__(name: str):
+    """Import a tool from its module on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    # Cache it so later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily imported tools alongside the module's own names."""
+    return sorted(set(globals()) | set(__all__))
@@ -11,10 +11,113 @@ to perform any Windows system operations including:
 - Any other system commands available in Windows CMD or PowerShell
 """
 
+import asyncio
+import os
+import signal
 import subprocess
+import sys
+from typing import Tuple
 from agents import function_tool
 
 
+# Seconds a command may run before it is killed
+COMMAND_TIMEOUT = 30
+
+# Seconds to wait for a killed command to exit before giving up on it
+KILL_TIMEOUT = 5
+
+# Bytes kept from each of stdout and stderr; the rest is read and discarded
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Bytes of each of stdout and stderr returned to the agent, so a runaway
+# command can't overflow the model's context window
+MAX_RESULT_BYTES = 32 * 1024
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count for messages, e.g. 512 bytes, 32 KiB or 1.5 MiB."""
+    if size < 1024:
+        return f"{size} bytes"
+    value = size / 1024
+    unit = "KiB"
+    if value >= 1024:
+        value /= 1024
+        unit = "MiB"
+    return f"{value:.1f}".rstrip("0").rstrip(".") + f" {unit}"
+
+
+async def _read_capped(stream: asyncio.StreamReader) -> Tuple[bytearray, int]:
+    """
+    Read a stream to the end, keeping at most MAX_OUTPUT_BYTES.
+    
+    The remainder is still drained so the command doesn't block on a
+    full pipe, but it is not held in memory.
+    
+    Args:
+        stream: Output stream of the command
+        
+    Returns:
+        Tuple[bytearray, int]: The kept output and the total bytes read
+    """
+    buffer = bytearray()
+    while len(buffer) < MAX_OUTPUT_BYTES:
+        chunk = await stream.read(MAX_OUTPUT_BYTES - len(buffer))
+        if not chunk:
+            return buffer, len(buffer)
+        buffer += chunk
+    
+    size = len(buffer)
+    while chunk := await stream.read(65536):
+        size += len(chunk)
+    return buffer, size
+
+
+# The shell gets its own process group so a timed out command can be
+# killed together with everything it started
+if sys.platform == "win32":
+    _PROCESS_GROUP_OPTIONS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _PROCESS_GROUP_OPTIONS = {"start_new_session": True}
+
+
+async def _kill_process_tree(process: asyncio.subprocess.Process) -> None:
+    """
+    Kill the shell together with every process it started.
+    
+    Killing only the shell would leave its children running and holding
+    the output pipes open, so waiting for the shell would last as long as
+    they do.
+    
+    Args:
+        process: Shell process started in its own process group
+    """
+    if sys.platform == "win32":
+        killer = await asyncio.create_subprocess_exec(
+            "taskkill", "/T", "/F", "/PID", str(process.pid),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        await killer.wait()
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    
+    # A process that left the group may still hold the pipes open, so
+    # don't wait on it indefinitely
+    try:
+        await asyncio.wait_for(process.wait(), timeout=KILL_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+
+
 @function_tool
 async def execute_shell_command(command: str) -> str:
     """
@@ -43,37 +146,63 @@ async def execute_shell_command(command: str) -> str:
         netstat -an - show network connections
     """
     try:
-        # Execute command with timeout to prevent hanging
-        # Use shell=True to support both cmd and PowerShell commands
-        result = subprocess.run(
+        # Run the command through the system shell to support both cmd and
+        # PowerShell commands, without blocking the event loop while it runs
+        process = await asyncio.create_subprocess_shell(
             command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30,  # 30 seconds timeout
-            encoding='utf-8',
-            errors='replace'  # Handle encoding issues gracefully
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **_PROCESS_GROUP_OPTIONS,
         )
         
+        # Wait with timeout to prevent hanging
+        try:
+            (stdout_bytes, stdout_size), (stderr_bytes, stderr_size), _ = (
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_capped(process.stdout),
+                        _read_capped(process.stderr),
+                        process.wait(),
+                    ),
+                    timeout=COMMAND_TIMEOUT,
+                )
+            )
+        except asyncio.TimeoutError:
+            await _kill_process_tree(process)
+            return f"Command timed out after {COMMAND_TIMEOUT} seconds: {command}"
+        
+        # Decode the returned part of each stream once, handling encoding
+        # issues gracefully
+        stdout = stdout_bytes[:MAX_RESULT_BYTES].decode('utf-8', errors='replace')
+        stderr = stderr_bytes[:MAX_RESULT_BYTES].decode('utf-8', errors='replace')
+        
         # Combine stdout and stderr for complete output
-        output = ""
-        if result.stdout:
-            output += f"Output:\n{result.stdout}"
-        if result.stderr:
-            output += f"\nError/Warning messages:\n{result.stderr}"
+        parts = []
+        if stdout:
+            parts.append("Output:\n")
+            parts.append(stdout)
+            if stdout_size > MAX_RESULT_BYTES:
+                parts.append(
+                    f"\n... output cut: showing the first {_format_size(MAX_RESULT_BYTES)}"
+                    f" of {_format_size(stdout_size)}"
+                )
+        if stderr:
+            parts.append("\nError/Warning messages:\n")
+            parts.append(stderr)
+            if stderr_size > MAX_RESULT_BYTES:
+                parts.append(
+                    f"\n... error output cut: showing the first"
+                    f" {_format_size(MAX_RESULT_BYTES)} of {_format_size(stderr_size)}"
+                )
         
         # Add return code information
-        if result.returncode != 0:
-            output += f"\nCommand exited with return code: {result.returncode}"
+        if process.returncode != 0:
+            parts.append(f"\nCommand exited with return code: {process.returncode}")
         else:
-            output += f"\nCommand executed successfully (return code: 0)"
+            parts.append("\nCommand executed successfully (return code: 0)")
             
-        return output if output else "Command executed but produced no output."
+        return "".join(parts)
         
-    except subprocess.TimeoutExpired:
-        return f"Command timed out after 30 seconds: {command}"
-    except subprocess.CalledProcessError as e:
-        return f"Command failed with return code {e.returncode}: {e.stderr or 'No error message'}"
     except Exception as e:
         return f"System error executing command: {str(e)}"
 
@@ -1,73 +1,365 @@
+import asyncio
+import io
 import os
+import threading
+import time
 import uuid
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+import grpc
+import numpy as np
 from agents import function_tool
-from openai import OpenAI
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct, VectorParams, Distance
+from config import ClientPool, create_openai_client, get_env
+from openai import AsyncOpenAI
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
+    SearchParams,
+    VectorParams,
+)
 
 # Collection configuration
 COLLECTION_NAME = "memory"
-EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1536"))
 
-# Lazy initialization of clients
-_openai_client = None
-_qdrant_client = None
+# Points per upsert request for bulk saves
+UPSERT_BATCH_SIZE = 256
+
+# Search over binary-quantized vectors, then rescore candidates with originals
+SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(
+        ignore=False,
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
+# Lazy initialization of client pools and the recall cache
+_openai_pool = None
+_qdrant_pool = None
+_recall_cache = None
+
+# Generation counter shared with the memory worker process, if any
+_memory_generation = None
+
+# Embeddings of recently seen texts and requests currently in flight
+_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+_inflight_embeddings: Dict[str, "asyncio.Future[List[List[float]]]"] = {}
+
+# Collection is checked once per process; failed checks are retried
+_collection_ready = False
+_collection_lock = asyncio.Lock()
+
+
+def _get_openai_pool() -> ClientPool[AsyncOpenAI]:
+    """Get or create the pool of async OpenAI clients."""
+    global _openai_pool
+    if _openai_pool is None:
+        _openai_pool = ClientPool(
+            create_openai_client, size=get_env().openai_pool_size
+        )
+    return _openai_pool
+
+
+def _get_qdrant_pool() -> ClientPool[AsyncQdrantClient]:
+    """Get or create the pool of async QDRANT clients."""
+    global _qdrant_pool
+    if _qdrant_pool is None:
+        _qdrant_pool = ClientPool(
+            lambda: AsyncQdrantClient(
+                url=get_env().qdrant_url,
+                prefer_grpc=True,
+                grpc_port=get_env().qdrant_grpc_port,
+                grpc_compression=grpc.Compression.Gzip
+            ),
+            size=get_env().qdrant_pool_size
+        )
+    return _qdrant_pool
 
 
-def _get_openai_client():
-    """Get or create OpenAI client."""
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    return _openai_client
+def _get_openai_client() -> AsyncOpenAI:
+    """Get the next async OpenAI client from the pool."""
+    return next(_get_openai_pool())
 
 
-def _get_qdrant_client():
-    """Get or create QDRANT client."""
-    global _qdrant_client
-    if _qdrant_client is None:
-        _qdrant_client = QdrantClient(url=os.getenv("QDRANT_URL", "http://localhost:6333"))
-    return _qdrant_client
+def _get_qdrant_client() -> AsyncQdrantClient:
+    """Get the next async QDRANT client from the pool."""
+    return next(_get_qdrant_pool())
 
 
-def _ensure_collection_exists():
-    """Ensure the memory collection exists in QDRANT."""
-    try:
-        qdrant_client = _get_qdrant_client()
-        # Check if collection exists
-        collections = qdrant_client.get_collections()
-        collection_names = [col.name for col in collections.collections]
+class _SemanticCache:
+    """
+    In-process LRU cache of recall results keyed by query embeddings.
 
-        if COLLECTION_NAME not in collection_names:
-            # Create collection with vector parameters
-            qdrant_client.create_collection(
-                collection_name=COLLECTION_NAME,
-                vectors_config=VectorParams(
-                    size=EMBEDDING_DIM,
-                    distance=Distance.COSINE
-                )
+    A query is served from cache when the same text was recalled before, or
+    when the cosine similarity between its embedding and a cached one reaches
+    the threshold. Stored vectors are L2-normalized in place when inserted so
+    a lookup is a single float32 BLAS matrix-vector product over all cached
+    rows, written into a preallocated scores buffer.
+
+    Memories are saved by the memory worker process, so the cache is
+    validated against the worker's generation counter and dropped as soon
+    as the worker has processed another conversation.
+    """
+
+    def __init__(self, capacity: int, dim: int, threshold: float, ttl: float):
+        self._capacity = capacity
+        self._threshold = threshold
+        self._ttl = ttl
+        self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self._scores = np.empty(capacity, dtype=np.float32)
+        self._limits = np.zeros(capacity, dtype=np.int64)
+        self._created = np.zeros(capacity, dtype=np.float64)
+        self._last_used = np.zeros(capacity, dtype=np.float64)
+        self._keys: List[Tuple[str, int]] = []
+        self._values: List[str] = []
+        self._rows: Dict[Tuple[str, int], int] = {}
+        self._count = 0
+        self._generation: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def validate(self, generation: int) -> None:
+        """Drop all cached results if the memory generation changed since they were stored."""
+        with self._lock:
+            if generation != self._generation:
+                self.clear()
+                self._generation = generation
+
+    def get(self, query: str, limit: int) -> Optional[str]:
+        """Return the cached result for exactly the same query text."""
+        with self._lock:
+            row = self._rows.get((query, limit))
+            if row is None:
+                return None
+            return self._hit(row, time.monotonic())
+
+    def search(self, vector: List[float], limit: int) -> Optional[str]:
+        """Return the cached result for a semantically equivalent query."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            now = time.monotonic()
+            query_vector = self._normalize(np.array(vector, dtype=np.float32))
+            scores = np.matmul(
+                self._matrix[:self._count],
+                query_vector,
+                out=self._scores[:self._count]
             )
-    except Exception as e:
-        print(f"Warning: Could not ensure collection exists: {e}")
+            stale = (self._limits[:self._count] != limit) | (
+                now - self._created[:self._count] > self._ttl
+            )
+            scores[stale] = -np.inf
+            row = int(np.argmax(scores))
+            if scores[row] < self._threshold:
+                return None
+            return self._hit(row, now)
+
+    def put(self, query: str, limit: int, vector: List[float], value: str) -> None:
+        """Store a recall result, evicting the least recently used entry if full."""
+        with self._lock:
+            key = (query, limit)
+            row = self._rows.get(key)
+            if row is None:
+                if self._count < self._capacity:
+                    row = self._count
+                    self._count += 1
+                    self._keys.append(key)
+                    self._values.append(value)
+                else:
+                    row = int(np.argmin(self._last_used))
+                    del self._rows[self._keys[row]]
+                    self._keys[row] = key
+                self._rows[key] = row
+
+            now = time.monotonic()
+            self._matrix[row] = vector
+            self._normalize(self._matrix[row])
+            self._limits[row] = limit
+            self._created[row] = now
+            self._last_used[row] = now
+            self._values[row] = value
+
+    def clear(self) -> None:
+        """Drop all cached results, e.g. after memory contents changed."""
+        with self._lock:
+            self._keys.clear()
+            self._values.clear()
+            self._rows.clear()
+            self._count = 0
+
+    def _hit(self, row: int, now: float) -> Optional[str]:
+        """Return the value stored in the row unless it has expired."""
+        if now - self._created[row] > self._ttl:
+            return None
+        self._last_used[row] = now
+        return self._values[row]
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """Scale a float32 vector to unit length in place."""
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+
+def set_memory_generation(generation: Any) -> None:
+    """
+    Track the generation counter of the memory worker process.
 
+    Recall results cached in this process are dropped whenever the worker
+    bumps the counter, so saves made there are seen without asking QDRANT.
 
-def _generate_embedding(text: str) -> List[float]:
-    """Generate embeddings for the given text using OpenAI."""
+    Args:
+        generation: Shared multiprocessing.Value bumped by the worker
+    """
+    global _memory_generation
+    _memory_generation = generation
+
+
+def _get_recall_cache() -> _SemanticCache:
+    """Get or create the recall cache, validated against the memory generation."""
+    global _recall_cache
+    if _recall_cache is None:
+        env = get_env()
+        _recall_cache = _SemanticCache(
+            env.recall_cache_size,
+            env.embedding_dim,
+            env.recall_cache_threshold,
+            env.recall_cache_ttl
+        )
+    if _memory_generation is not None:
+        _recall_cache.validate(_memory_generation.value)
+    return _recall_cache
+
+
+async def _ensure_collection_exists():
+    """Ensure the memory collection exists in QDRANT, once per process."""
+    global _collection_ready
+    if _collection_ready:
+        return
+
+    async with _collection_lock:
+        if _collection_ready:
+            return
+
+        try:
+            qdrant_client = _get_qdrant_client()
+            # Check if collection exists
+            collections = await qdrant_client.get_collections()
+            collection_names = [col.name for col in collections.collections]
+
+            if COLLECTION_NAME not in collection_names:
+                # Create collection with binary quantization: compact bit vectors
+                # stay in RAM for search, full vectors live on disk for rescoring
+                await qdrant_client.create_collection(
+                    collection_name=COLLECTION_NAME,
+                    vectors_config=VectorParams(
+                        size=get_env().embedding_dim,
+                        distance=Distance.COSINE,
+                        on_disk=True
+                    ),
+                    quantization_config=BinaryQuantization(
+                        binary=BinaryQuantizationConfig(always_ram=True)
+                    )
+                )
+            _collection_ready = True
+        except Exception as e:
+            print(f"Warning: Could not ensure collection exists: {e}")
+
+
+async def warmup_memory() -> None:
+    """
+    Open connections to OpenAI and QDRANT ahead of the first memory operation.
+
+    Makes sure the memory collection exists and opens a connection for
+    every pooled client concurrently, so the first recall or save does not
+    pay connection setup latency. Failures are reported and otherwise ignored.
+    """
+    results = await asyncio.gather(
+        _ensure_collection_exists(),
+        *(client.models.list() for client in _get_openai_pool().clients),
+        *(client.get_collections() for client in _get_qdrant_pool().clients),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Warning: Could not warm up memory clients: {result}")
+
+
+async def close_clients() -> None:
+    """
+    Close the pooled OpenAI and QDRANT clients, if they were created.
+
+    This should be called when the application is shutting down.
+    """
+    global _openai_pool, _qdrant_pool
+    pools = [pool for pool in (_openai_pool, _qdrant_pool) if pool is not None]
+    _openai_pool = _qdrant_pool = None
+    await asyncio.gather(*(client.close() for pool in pools for client in pool.clients))
+
+
+async def _generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for a batch of texts with a single OpenAI request."""
     try:
         openai_client = _get_openai_client()
-        response = openai_client.embeddings.create(
-            input=text,
-            model=EMBEDDING_MODEL
+        response = await openai_client.embeddings.create(
+            input=texts,
+            model=get_env().embedding_model
         )
-        return response.data[0].embedding
+        return [item.embedding for item in response.data]
     except Exception as e:
         raise Exception(f"Failed to generate embedding: {str(e)}")
 
 
+async def _generate_embedding(text: str) -> List[float]:
+    """
+    Generate embeddings for the given text using OpenAI.
+
+    Recently embedded texts are served from an LRU cache, and concurrent
+    requests for the same text share a single OpenAI call.
+    """
+    vector = _embedding_cache.get(text)
+    if vector is not None:
+        _embedding_cache.move_to_end(text)
+        return vector
+
+    request = _inflight_embeddings.get(text)
+    if request is None:
+        request = asyncio.ensure_future(_generate_embeddings([text]))
+        _inflight_embeddings[text] = request
+        request.add_done_callback(lambda _: _inflight_embeddings.pop(text, None))
+
+    # Shield the shared request so one cancelled caller doesn't fail the others
+    vector = (await asyncio.shield(request))[0]
+    _embedding_cache[text] = vector
+    if len(_embedding_cache) > get_env().embedding_cache_size:
+        _embedding_cache.popitem(last=False)
+    return vector
+
+
+def _build_point(content: str, vector: List[float]) -> PointStruct:
+    """Build a QDRANT point with a fresh ID for the given memory content."""
+    # Nanosecond timestamp in the high 64 bits keeps IDs sortable by insertion
+    timestamp = time.time_ns()
+    memory_id = uuid.UUID(int=(timestamp << 64) | int.from_bytes(os.urandom(8), "big"))
+    return PointStruct(
+        id=str(memory_id),
+        vector=vector,
+        payload={
+            "content": content,
+            "timestamp": timestamp,
+        }
+    )
+
+
 @function_tool
-def save_memory(content: str) -> str:
+async def save_memory(content: str) -> str:
     """
     Save information to the vector memory database.
 
@@ -78,39 +370,95 @@ def save_memory(content: str) -> str:
         Confirmation message with memory ID
     """
     try:
-        _ensure_collection_exists()
-
-        # Generate unique ID for this memory
-        memory_id = str(uuid.uuid4())
-
-        # Generate embedding for the content
-        vector = _generate_embedding(content)
-
-        # Create point with vector and payload
-        point = PointStruct(
-            id=memory_id,
-            vector=vector,
-            payload={
-                "content": content,
-                "timestamp": str(uuid.uuid1().time),  # Time-based UUID for sorting
-            }
-        )
+        await _ensure_collection_exists()
+
+        # Generate embedding and build point with unique ID
+        point = _build_point(content, await _generate_embedding(content))
 
-        # Upsert to QDRANT
+        # Upsert to QDRANT without waiting for indexing
         qdrant_client = _get_qdrant_client()
-        qdrant_client.upsert(
+        await qdrant_client.upsert(
             collection_name=COLLECTION_NAME,
-            points=[point]
+            points=[point],
+            wait=False
         )
+        _get_recall_cache().clear()
 
-        return f"Memory saved successfully with ID: {memory_id}"
+        return f"Memory saved successfully with ID: {point.id}"
 
     except Exception as e:
         return f"Failed to save memory: {str(e)}"
 
 
 @function_tool
-def recall_memory(query: str, limit: int = 5) -> str:
+async def save_memories(contents: List[str]) -> str:
+    """
+    Save several pieces of information to the vector memory database at once.
+
+    Prefer this over repeated save_memory calls when storing multiple facts:
+    all embeddings are generated in one request and stored in a few batched
+    upserts.
+
+    Args:
+        contents: List of text contents to store in memory, one fact per item
+
+    Returns:
+        Confirmation message with the IDs of saved memories
+    """
+    contents = [content for content in contents if content.strip()]
+    if not contents:
+        return "No memories to save."
+
+    try:
+        await _ensure_collection_exists()
+
+        # One embeddings request for the whole batch
+        vectors = await _generate_embeddings(contents)
+        points = [
+            _build_point(content, vector)
+            for content, vector in zip(contents, vectors)
+        ]
+
+        # Concurrent batched upserts without waiting for indexing
+        await asyncio.gather(*(
+            _get_qdrant_client().upsert(
+                collection_name=COLLECTION_NAME,
+                points=points[start:start + UPSERT_BATCH_SIZE],
+                wait=False
+            )
+            for start in range(0, len(points), UPSERT_BATCH_SIZE)
+        ))
+        _get_recall_cache().clear()
+
+        memory_ids = ", ".join(str(point.id) for point in points)
+        return f"Saved {len(points)} memories successfully with IDs: {memory_ids}"
+
+    except Exception as e:
+        return f"Failed to save memories: {str(e)}"
+
+
+def _format_results(search_results) -> str:
+    """Format QDRANT search results as a numbered list for the agent."""
+    if not search_results:
+        return "No relevant memories found."
+
+    snippet_length = get_env().recall_snippet_length
+    buffer = io.StringIO()
+    buffer.write("Relevant memories:\n")
+    for i, result in enumerate(search_results, 1):
+        content = result.payload.get("content", "")
+        if len(content) > snippet_length:
+            content = content[:snippet_length] + "..."
+        buffer.write(
+            f"\n{i}. [ID: {result.id}] (Score: {result.score:.3f})\n"
+            f"   {content}\n"
+        )
+
+    return buffer.getvalue()
+
+
+@function_tool
+async def recall_memory(query: str, limit: int = 5) -> str:
     """
     Search and retrieve relevant information from memory using semantic similarity.
 
@@ -122,35 +470,104 @@ def recall_memory(query: str, limit: int = 5) -> str:
         Formatted string with relevant memories or "No relevant memories found"
     """
     try:
-        _ensure_collection_exists()
+        recall_cache = _get_recall_cache()
+
+        # Repeated queries are served without any network round-trip
+        cached = recall_cache.get(query, limit)
+        if cached is not None:
+            return cached
+
+        await _ensure_collection_exists()
 
         # Generate embedding for the query
-        query_vector = _generate_embedding(query)
+        query_vector = await _generate_embedding(query)
+
+        # Semantically equivalent queries skip the QDRANT search
+        cached = recall_cache.search(query_vector, limit)
+        if cached is not None:
+            return cached
 
         # Search for similar vectors
         qdrant_client = _get_qdrant_client()
-        search_results = qdrant_client.search(
+        response = await qdrant_client.query_points(
             collection_name=COLLECTION_NAME,
-            query_vector=query_vector,
-            limit=limit
+            query=query_vector,
+            limit=limit,
+            search_params=SEARCH_PARAMS,
+            score_threshold=get_env().recall_score_threshold
         )
 
-        if not search_results:
-            return "No relevant memories found."
+        recalled = _format_results(response.points)
+        recall_cache.put(query, limit, query_vector, recalled)
+        return recalled
 
-        # Format results
-        results = []
-        for i, result in enumerate(search_results, 1):
-            content = result.payload.get("content", "")
-            score = result.score
-            memory_id = result.id
+    except Exception as e:
+        return f"Failed to recall memory: {str(e)}"
+
+
+@function_tool
+async def recall_memories_batch(queries: List[str], limit: int = 5) -> str:
+    """
+    Search memory for several queries at once using semantic similarity.
 
-            results.append(
-                f"{i}. [ID: {memory_id}] (Score: {score:.3f})\n"
-                f"   {content}\n"
+    Prefer this over repeated recall_memory calls when checking multiple
+    facts: all queries are embedded in one request and searched in one
+    QDRANT round-trip.
+
+    Args:
+        queries: List of search queries to find relevant memories for
+        limit: Maximum number of results to return per query (default: 5)
+
+    Returns:
+        Relevant memories grouped by query
+    """
+    try:
+        recall_cache = _get_recall_cache()
+        recalled: Dict[str, str] = {}
+
+        # Repeated queries are served without any network round-trip
+        for query in queries:
+            cached = recall_cache.get(query, limit)
+            if cached is not None:
+                recalled[query] = cached
+
+        pending = [query for query in dict.fromkeys(queries) if query not in recalled]
+        if pending:
+            await _ensure_collection_exists()
+
+            # One embeddings request for all remaining queries
+            vectors = dict(zip(pending, await _generate_embeddings(pending)))
+
+            # Semantically equivalent queries skip the QDRANT search
+            for query in pending:
+                cached = recall_cache.search(vectors[query], limit)
+                if cached is not None:
+                    recalled[query] = cached
+            pending = [query for query in pending if query not in recalled]
+
+        if pending:
+            # One batched search for everything still unresolved
+            qdrant_client = _get_qdrant_client()
+            responses = await qdrant_client.query_batch_points(
+                collection_name=COLLECTION_NAME,
+                requests=[
+                    QueryRequest(
+                        query=vectors[query],
+                        limit=limit,
+                        params=SEARCH_PARAMS,
+                        score_threshold=get_env().recall_score_threshold,
+                        with_payload=True
+                    )
+                    for query in pending
+                ]
             )
+            for query, response in zip(pending, responses):
+                recalled[query] = _format_results(response.points)
+                recall_cache.put(query, limit, vectors[query], recalled[query])
 
-        return "Relevant memories:\n\n" + "\n".join(results)
+        return "\n".join(
+            f"Query: {query}\n{recalled[query]}" for query in dict.fromkeys(queries)
+        )
 
     except Exception as e:
-        return f"Failed to recall memory: {str(e)}"
\ No newline at end of file
+        return f"Failed to recall memories: {str(e)}"